@@ -335,10 +335,13 @@ class Request:  # pylint: disable=too-many-instance-attributes
         self.raw_request = raw_request
         self._form_data = None
         self._cookies = None
+        self._content_length = None
 
         if raw_request is None:
             raise ValueError("raw_request cannot be None")
 
+        self._empty_line_index = raw_request.find(b"\r\n\r\n")
+
         try:
             (
                 self.method,
@@ -350,6 +353,17 @@ class Request:  # pylint: disable=too-many-instance-attributes
         except Exception as error:
             raise ValueError("Unparseable raw_request: ", raw_request) from error
 
+    @property
+    def content_length(self) -> int:
+        """
+        Value of the ``Content-Length`` header, as an `int`. ``0`` if the header is not present.
+
+        Parsed once and cached, as it is checked on every request.
+        """
+        if self._content_length is None:
+            self._content_length = int(self.headers.get("Content-Length", 0))
+        return self._content_length
+
     @property
     def body(self) -> bytes:
         """Body of the request, as bytes."""
@@ -357,7 +371,9 @@ class Request:  # pylint: disable=too-many-instance-attributes
 
     @body.setter
     def body(self, body: bytes) -> None:
-        self.raw_request = self._raw_header_bytes + b"\r\n\r\n" + body
+        header_bytes = self._raw_header_bytes
+        self.raw_request = header_bytes + b"\r\n\r\n" + body
+        self._empty_line_index = len(header_bytes)
 
     @staticmethod
     def _parse_cookies(cookie_header: str) -> None:
@@ -450,16 +466,12 @@ class Request:  # pylint: disable=too-many-instance-attributes
     @property
     def _raw_header_bytes(self) -> bytes:
         """Returns headers bytes."""
-        empty_line_index = self.raw_request.find(b"\r\n\r\n")
-
-        return self.raw_request[:empty_line_index]
+        return self.raw_request[: self._empty_line_index]
 
     @property
     def _raw_body_bytes(self) -> bytes:
         """Returns body bytes."""
-        empty_line_index = self.raw_request.find(b"\r\n\r\n")
-
-        return self.raw_request[empty_line_index + 4 :]
+        return self.raw_request[self._empty_line_index + 4 :]
 
     @staticmethod
     def _parse_request_header(
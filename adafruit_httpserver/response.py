@@ -48,6 +48,10 @@ from .headers import Headers
 from .interfaces import _ISocket
 
 
+_SINGLE_SEND_MAX_BODY_LENGTH = 1024
+"""Bodies up to this size are sent together with the headers in one send call."""
+
+
 class Response:  # pylint: disable=too-few-public-methods
     """
     Response to a given `Request`. Use in `Server.route` handler functions.
@@ -91,16 +95,14 @@ class Response:  # pylint: disable=too-few-public-methods
         self._content_type = content_type
         self._size = 0
 
-    def _send_headers(
+    def _encode_headers(
         self,
         content_length: Optional[int] = None,
         content_type: str = None,
-    ) -> None:
+    ) -> bytes:
         headers = self._headers.copy()
 
-        response_message_header = (
-            f"HTTP/1.1 {self._status.code} {self._status.text}\r\n"
-        )
+        response_message_header = self._status.line
 
         headers.setdefault(
             "Content-Type", content_type or self._content_type or MIMETypes.DEFAULT
@@ -116,17 +118,36 @@ class Response:  # pylint: disable=too-few-public-methods
                 response_message_header += f"{header}: {value}\r\n"
         response_message_header += "\r\n"
 
+        return response_message_header.encode("utf-8")
+
+    def _send_headers(
+        self,
+        content_length: Optional[int] = None,
+        content_type: str = None,
+    ) -> None:
         self._send_bytes(
-            self._request.connection, response_message_header.encode("utf-8")
+            self._request.connection, self._encode_headers(content_length, content_type)
         )
 
+    def _send_headers_and_body(self, encoded_body: bytes, content_type: str) -> None:
+        """
+        Sends headers and body, coalescing small bodies with the headers into a single
+        send call to avoid an extra network write per response.
+        """
+        encoded_headers = self._encode_headers(len(encoded_body), content_type)
+
+        if len(encoded_body) <= _SINGLE_SEND_MAX_BODY_LENGTH:
+            self._send_bytes(self._request.connection, encoded_headers + encoded_body)
+        else:
+            self._send_bytes(self._request.connection, encoded_headers)
+            self._send_bytes(self._request.connection, encoded_body)
+
     def _send(self) -> None:
         encoded_body = (
             self._body.encode("utf-8") if isinstance(self._body, str) else self._body
         )
 
-        self._send_headers(len(encoded_body), self._content_type)
-        self._send_bytes(self._request.connection, encoded_body)
+        self._send_headers_and_body(encoded_body, self._content_type)
         self._close_connection()
 
     def _send_bytes(
@@ -282,9 +303,12 @@ class FileResponse(Response):  # pylint: disable=too-few-public-methods
         self._send_headers(self._file_length, self._content_type)
 
         if not self._head_only:
+            # Reuse one buffer for all chunks instead of allocating bytes per read
+            buffer = bytearray(self._buffer_size)
+            buffer_view = memoryview(buffer)
             with open(self._full_file_path, "rb") as file:
-                while bytes_read := file.read(self._buffer_size):
-                    self._send_bytes(self._request.connection, bytes_read)
+                while bytes_read := file.readinto(buffer):
+                    self._send_bytes(self._request.connection, buffer_view[:bytes_read])
         self._close_connection()
 
 
@@ -337,22 +361,31 @@ class ChunkedResponse(Response):  # pylint: disable=too-few-public-methods
         self._headers.setdefault("Transfer-Encoding", "chunked")
         self._body = body
 
-    def _send_chunk(self, chunk: Union[str, bytes] = "") -> None:
+    @staticmethod
+    def _append_chunk(buffer: bytearray, chunk: Union[str, bytes] = "") -> None:
         encoded_chunk = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
 
-        self._send_bytes(self._request.connection, b"%x\r\n" % len(encoded_chunk))
-        self._send_bytes(self._request.connection, encoded_chunk)
-        self._send_bytes(self._request.connection, b"\r\n")
+        buffer += b"%x\r\n" % len(encoded_chunk)
+        buffer += encoded_chunk
+        buffer += b"\r\n"
 
     def _send(self) -> None:
         self._send_headers()
 
+        # Coalesce chunk framing and data into fewer send calls
+        buffer = bytearray()
+
         for chunk in self._body():
             if 0 < len(chunk):  # Don't send empty chunks
-                self._send_chunk(chunk)
+                self._append_chunk(buffer, chunk)
+
+            if _SINGLE_SEND_MAX_BODY_LENGTH <= len(buffer):
+                self._send_bytes(self._request.connection, buffer)
+                buffer = bytearray()
 
         # Empty chunk to indicate end of response
-        self._send_chunk()
+        self._append_chunk(buffer)
+        self._send_bytes(self._request.connection, buffer)
         self._close_connection()
 
 
@@ -398,8 +431,7 @@ class JSONResponse(Response):  # pylint: disable=too-few-public-methods
     def _send(self) -> None:
         encoded_data = json.dumps(self._data).encode("utf-8")
 
-        self._send_headers(len(encoded_data), "application/json")
-        self._send_bytes(self._request.connection, encoded_data)
+        self._send_headers_and_body(encoded_data, "application/json")
         self._close_connection()
 
 
@@ -663,6 +695,7 @@ class Websocket(Response):  # pylint: disable=too-few-public-methods
         self._headers.setdefault("Sec-WebSocket-Accept", sec_accept_key)
         self._headers.setdefault("Content-Type", None)
         self._buffer_size = buffer_size
+        self._buffer = bytearray(buffer_size)
         self.closed = False
 
         request.connection.setblocking(False)
@@ -682,7 +715,8 @@ class Websocket(Response):  # pylint: disable=too-few-public-methods
         return fin, opcode, has_mask, length
 
     def _read_frame(self):
-        buffer = bytearray(self._buffer_size)
+        # Scratch buffer preallocated in __init__, reused for every frame
+        buffer = self._buffer
 
         header_length = self._request.connection.recv_into(buffer, 2)
         header_bytes = buffer[:header_length]
@@ -693,9 +727,8 @@ class Websocket(Response):  # pylint: disable=too-few-public-methods
         if fin != Websocket.FIN and opcode == Websocket.CONT:
             return Websocket.CONT, None
 
-        payload = bytes()
         if fin == Websocket.FIN and opcode == Websocket.CLOSE:
-            return Websocket.CLOSE, payload
+            return Websocket.CLOSE, bytes()
 
         if length < 0:
             length = self._request.connection.recv_into(buffer, -length)
@@ -705,15 +738,17 @@ class Websocket(Response):  # pylint: disable=too-few-public-methods
             mask_length = self._request.connection.recv_into(buffer, 4)
             mask = buffer[:mask_length]
 
+        payload = bytearray()
         while 0 < length:
             payload_length = self._request.connection.recv_into(buffer, length)
             payload += buffer[: min(payload_length, length)]
             length -= min(payload_length, length)
 
         if has_mask:
-            payload = bytes(byte ^ mask[idx % 4] for idx, byte in enumerate(payload))
+            for idx in range(len(payload)):  # pylint: disable=consider-using-enumerate
+                payload[idx] ^= mask[idx % 4]
 
-        return opcode, payload
+        return opcode, bytes(payload)
 
     def _handle_frame(self, opcode: int, payload: bytes) -> Union[str, bytes, None]:
         # TODO: Handle continuation frames, currently not supported
@@ -20,26 +20,67 @@ import re
 from .methods import GET
 
 
+_PARAMETER_NAME_REGEX = re.compile(r"<(\w+)>")
+_PARAMETER_NOT_BETWEEN_SLASHES_REGEX = re.compile(r"[^/]<[^/]+>|<[^/]+>[^/]")
+_WILDCARD_NOT_BETWEEN_SLASHES_REGEX = re.compile(r"[^/.]\.\.\.\.?|\.?\.\.\.[^/.]")
+
+
 class Route:
     """Route definition for different paths, see `adafruit_httpserver.server.Server.route`."""
 
     @staticmethod
-    def _prepare_path_pattern(path: str, append_slash: bool) -> str:
-        # Escape all dots
-        path = re.sub(r"\.", r"\\.", path)
-
-        # Replace url parameters with regex groups
-        path = re.sub(r"<\w+>", r"([^/]+)", path)
+    def _is_parameter_name(name: str) -> bool:
+        return bool(name) and all(
+            character.isalnum() or character == "_" for character in name
+        )
 
-        # Replace wildcards with corresponding regex
-        path = path.replace(r"\.\.\.\.", r".+").replace(r"\.\.\.", r"[^/]+")
+    @classmethod
+    def _prepare_path_pattern(cls, path: str, append_slash: bool) -> str:
+        # Emit the pattern in a single left-to-right pass over the path,
+        # instead of separate substitution passes for dots, parameters and wildcards.
+        pattern_parts = ["^"]
+        index, path_length = 0, len(path)
+
+        while index < path_length:
+            character = path[index]
+
+            # URL parameter e.g. "<parameter>" matches a single path segment
+            if character == "<":
+                closing_index = path.find(">", index + 1)
+                if closing_index != -1 and cls._is_parameter_name(
+                    path[index + 1 : closing_index]
+                ):
+                    pattern_parts.append(r"([^/]+)")
+                    index = closing_index + 1
+                    continue
+
+            # "..." matches a single path segment, "...." any number of them
+            if character == ".":
+                dots_count = 1
+                while (
+                    index + dots_count < path_length and path[index + dots_count] == "."
+                ):
+                    dots_count += 1
+                if dots_count == 4:
+                    pattern_parts.append(r".+")
+                elif dots_count == 3:
+                    pattern_parts.append(r"[^/]+")
+                else:
+                    pattern_parts.append(r"\." * dots_count)
+                index += dots_count
+                continue
+
+            pattern_parts.append(character)
+            index += 1
 
         # Add optional slash at the end if append_slash is True
         if append_slash:
-            path += r"/?"
+            pattern_parts.append(r"/?")
+
+        # Add end of string anchor
+        pattern_parts.append("$")
 
-        # Add start and end of string anchors
-        return f"^{path}$"
+        return "".join(pattern_parts)
 
     def __init__(
         self,
@@ -51,14 +92,19 @@ class Route:
     ) -> None:
         self._validate_path(path, append_slash)
 
+        if handler is not None and not callable(handler):
+            raise ValueError("Handler must be callable.")
+
         self.path = path
         self.methods = (
-            set(methods) if isinstance(methods, (set, list, tuple)) else set([methods])
+            frozenset(methods)
+            if isinstance(methods, (set, list, tuple))
+            else frozenset([methods])
         )
         self.handler = handler
-        self.parameters_names = [
-            name[1:-1] for name in re.compile(r"/[^<>]*/?").split(path) if name != ""
-        ]
+        self._is_literal = "<" not in path and "..." not in path and not append_slash
+        self._static_prefix = path.split("<")[0].split(".")[0]
+        self.parameters_names = _PARAMETER_NAME_REGEX.findall(path)
         self.path_pattern = re.compile(self._prepare_path_pattern(path, append_slash))
 
     @staticmethod
@@ -75,10 +121,10 @@ class Route:
         if "<>" in path:
             raise ValueError("All URL parameters must be named.")
 
-        if re.search(r"[^/]<[^/]+>|<[^/]+>[^/]", path):
+        if _PARAMETER_NOT_BETWEEN_SLASHES_REGEX.search(path):
             raise ValueError("All URL parameters must be between slashes.")
 
-        if re.search(r"[^/.]\.\.\.\.?|\.?\.\.\.[^/.]", path):
+        if _WILDCARD_NOT_BETWEEN_SLASHES_REGEX.search(path):
             raise ValueError("... and .... must be between slashes")
 
         if "....." in path:
@@ -127,6 +173,15 @@ class Route:
         if method not in self.methods:
             return False, None
 
+        # Parameterless paths without append_slash need only a string comparison
+        if self._is_literal:
+            return (True, {}) if path == self.path else (False, None)
+
+        # A path that does not start with the literal part of the route cannot match,
+        # so the regex can be skipped entirely
+        if not path.startswith(self._static_prefix):
+            return False, None
+
         path_match = self.path_pattern.match(path)
         if path_match is None:
             return False, None
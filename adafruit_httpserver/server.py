@@ -46,10 +46,40 @@ REQUEST_HANDLED_RESPONSE_SENT = "request_handled_response_sent"
 # CircuitPython does not have these error codes
 MBEDTLS_ERR_SSL_FATAL_ALERT_MESSAGE = -30592
 
+# Errnos that mean "no request to handle right now" rather than a real failure:
+# no data available, connection reset by peer and failed TLS handshake respectively
+_SUPPRESSIBLE_ERRNOS = frozenset(
+    (EAGAIN, ECONNRESET, MBEDTLS_ERR_SSL_FATAL_ALERT_MESSAGE)
+)
+
+_SSL_CERTIFICATE_UNKNOWN_REASON = "SSLV3_ALERT_CERTIFICATE_UNKNOWN"
+
+# Largest body buffer allocated upfront from the declared Content-Length alone;
+# larger bodies grow the buffer only as data actually arrives, so a hostile
+# header cannot force a huge allocation
+_MAX_PREALLOCATED_BODY_LENGTH = 16 * 1024
+
+
+class _BoundHandler:  # pylint: disable=too-few-public-methods
+    """
+    Route handler bound to the URL parameter values extracted from a matched path.
+
+    Cheaper than creating a closure for every dispatched request.
+    """
+
+    def __init__(self, handler: Callable, url_parameters: Dict[str, str]) -> None:
+        self.handler = handler
+        self.url_parameters = url_parameters
+
+    def __call__(self, request: Request) -> "Response":
+        return self.handler(request, **self.url_parameters)
+
 
 class Server:  # pylint: disable=too-many-instance-attributes
     """A basic socket-based HTTP server."""
 
+    _HANDLER_CACHE_MAX_SIZE = 64
+
     host: str
     """Host name or IP address the server is listening on. ``None`` if server is stopped."""
 
@@ -115,15 +145,27 @@ class Server:  # pylint: disable=too-many-instance-attributes
         :param str keyfile: Path to the private key file, required if ``https`` is True
         """
         self._buffer = bytearray(1024)
+        self._buffer_view = memoryview(self._buffer)
         self._timeout = 1
 
         self._auths = []
         self._routes: "List[Route]" = []
+        self._static_routes: "Dict[str, List[Tuple[int, Route]]]" = {}
+        self._dynamic_routes: "List[Tuple[int, Route]]" = []
+        self._handler_cache: "Dict[Tuple[str, str], Callable]" = {}
         self.headers = Headers()
 
         self._socket_source = socket_source
         self._sock = None
 
+        # Not all socket pools expose TCP_NODELAY, resolve the constants once
+        self._tcp_nodelay_options = (
+            (socket_source.IPPROTO_TCP, socket_source.TCP_NODELAY)
+            if hasattr(socket_source, "IPPROTO_TCP")
+            and hasattr(socket_source, "TCP_NODELAY")
+            else None
+        )
+
         self.host, self.port = None, None
         self.root_path = root_path
         self.https = https
@@ -195,11 +237,29 @@ class Server:  # pylint: disable=too-many-instance-attributes
         """
 
         def route_decorator(func: Callable) -> Callable:
-            self._routes.append(Route(path, methods, func, append_slash=append_slash))
+            self._add_route(Route(path, methods, func, append_slash=append_slash))
             return func
 
         return route_decorator
 
+    def _add_route(self, route: Route) -> None:
+        """
+        Adds a route to the server, indexing literal paths separately from parameterized
+        and wildcard ones, so that literal paths can be looked up with a single dict access.
+
+        The registration order is stored with each route to keep the documented
+        first-added-wins behaviour when a path matches both kinds of routes.
+        """
+        index = len(self._routes)
+        self._routes.append(route)
+
+        if route._is_literal:  # pylint: disable=protected-access
+            self._static_routes.setdefault(route.path, []).append((index, route))
+        else:
+            self._dynamic_routes.append((index, route))
+
+        self._handler_cache.clear()
+
     def add_routes(self, routes: List[Route]) -> None:
         """
         Add multiple routes at once.
@@ -220,7 +280,8 @@ class Server:  # pylint: disable=too-many-instance-attributes
                 external_route2,
             ]}
         """
-        self._routes.extend(routes)
+        for route in routes:
+            self._add_route(route)
 
     def _verify_can_start(self, host: str, port: int) -> None:
         """Check if the server can be successfully started. Raises RuntimeError if not."""
@@ -274,7 +335,9 @@ class Server:  # pylint: disable=too-many-instance-attributes
             sock = ssl_context.wrap_socket(sock, server_side=True)
 
         sock.bind((host, port))
-        sock.listen(10)
+        # Wider accept queue on CPython to survive connection bursts; CircuitPython
+        # socket pools are backed by lwIP, where a large backlog only wastes memory.
+        sock.listen(10 if implementation.name == "circuitpython" else 128)
         sock.setblocking(False)  # Non-blocking socket
 
         return sock
@@ -315,37 +378,74 @@ class Server:  # pylint: disable=too-many-instance-attributes
 
     def _receive_header_bytes(self, sock: _ISocket) -> bytes:
         """Receive bytes until a empty line is received."""
-        received_bytes = bytes()
-        while b"\r\n\r\n" not in received_bytes:
+        received_bytes = bytearray()
+        search_start = 0
+        while received_bytes.find(b"\r\n\r\n", search_start) == -1:
+            # The delimiter can straddle the last append by at most 3 bytes,
+            # so there is no need to rescan everything received so far.
+            search_start = max(len(received_bytes) - 3, 0)
             try:
                 length = sock.recv_into(self._buffer, len(self._buffer))
-                received_bytes += self._buffer[:length]
+                received_bytes.extend(self._buffer_view[:length])
             except OSError as ex:
                 if ex.errno == ETIMEDOUT:
                     break
                 raise
             except Exception as ex:
                 raise ex
-        return received_bytes
+        return bytes(received_bytes)
 
+    @staticmethod
     def _receive_body_bytes(
-        self,
         sock: _ISocket,
         received_body_bytes: bytes,
         content_length: int,
     ) -> bytes:
         """Receive bytes until the given content length is received."""
-        while len(received_body_bytes) < content_length:
+        if content_length <= len(received_body_bytes):
+            return bytes(received_body_bytes[:content_length])
+
+        if content_length <= _MAX_PREALLOCATED_BODY_LENGTH:
+            # Preallocate the whole body and receive directly into its tail,
+            # skipping the intermediate receive buffer entirely
+            received_bytes = bytearray(content_length)
+            received_bytes_view = memoryview(received_bytes)
+            offset = len(received_body_bytes)
+            received_bytes[:offset] = received_body_bytes
+
+            while offset < content_length:
+                try:
+                    length = sock.recv_into(
+                        received_bytes_view[offset:], content_length - offset
+                    )
+                    offset += length
+                except OSError as ex:
+                    if ex.errno == ETIMEDOUT:
+                        break
+                    raise
+                except Exception as ex:
+                    raise ex
+            return bytes(received_bytes_view[:offset])
+
+        # The declared length is untrusted, so large bodies grow the buffer only
+        # as data actually arrives instead of being preallocated upfront
+        received_bytes = bytearray(received_body_bytes)
+        buffer = bytearray(_MAX_PREALLOCATED_BODY_LENGTH)
+        buffer_view = memoryview(buffer)
+
+        while len(received_bytes) < content_length:
             try:
-                length = sock.recv_into(self._buffer, len(self._buffer))
-                received_body_bytes += self._buffer[:length]
+                length = sock.recv_into(
+                    buffer, min(len(buffer), content_length - len(received_bytes))
+                )
+                received_bytes.extend(buffer_view[:length])
             except OSError as ex:
                 if ex.errno == ETIMEDOUT:
                     break
                 raise
             except Exception as ex:
                 raise ex
-        return received_body_bytes[:content_length]
+        return bytes(received_bytes)
 
     def _receive_request(
         self,
@@ -363,17 +463,15 @@ class Server:  # pylint: disable=too-many-instance-attributes
 
         request = Request(self, sock, client_address, header_bytes)
 
-        content_length = int(request.headers.get_directive("Content-Length", 0))
-        received_body_bytes = request.body
+        content_length = request.content_length
 
-        # Receiving remaining body bytes
-        request.body = self._receive_body_bytes(
-            sock, received_body_bytes, content_length
-        )
+        # Receiving remaining body bytes, skipped entirely for bodyless requests
+        if content_length != len(request.body):
+            request.body = self._receive_body_bytes(sock, request.body, content_length)
 
         return request
 
-    def _find_handler(  # pylint: disable=cell-var-from-loop
+    def _find_handler(
         self, method: str, path: str
     ) -> Union[Callable[..., "Response"], None]:
         """
@@ -390,15 +488,48 @@ class Server:  # pylint: disable=too-many-instance-attributes
                 request.path == "/example/123" # True
                 my_parameter == "123" # True
         """
-        for route in self._routes:
+        # Repeated requests for the same method and path reuse the previously bound handler
+        cache_key = (method, path)
+        bound_handler = self._handler_cache.get(cache_key)
+        if bound_handler is not None:
+            return bound_handler
+
+        bound_handler = self._resolve_handler(method, path)
+
+        if bound_handler is not None:
+            if len(self._handler_cache) >= self._HANDLER_CACHE_MAX_SIZE:
+                del self._handler_cache[next(iter(self._handler_cache))]
+            self._handler_cache[cache_key] = bound_handler
+
+        return bound_handler
+
+    def _resolve_handler(
+        self, method: str, path: str
+    ) -> Union[Callable[..., "Response"], None]:
+        """Resolves a handler by searching the registered routes, without caching."""
+
+        # Literal paths are a single dict lookup, but an earlier registered dynamic route
+        # matching the same path still takes precedence.
+        static_route_index, static_route = len(self._routes), None
+        for index, route in self._static_routes.get(path, ()):
+            if method in route.methods:
+                static_route_index, static_route = index, route
+                break
+
+        for index, route in self._dynamic_routes:
+            if static_route_index < index:
+                break
+
             route_matches, url_parameters = route.matches(method, path)
 
             if route_matches:
+                # Binding is only needed when there are URL parameter values to forward
+                if url_parameters:
+                    return _BoundHandler(route.handler, url_parameters)
+                return route.handler
 
-                def wrapped_handler(request):
-                    return route.handler(request, **url_parameters)
-
-                return wrapped_handler
+        if static_route is not None:
+            return static_route.handler
 
         return None
 
@@ -410,8 +541,8 @@ class Server:  # pylint: disable=too-many-instance-attributes
             if self._auths:
                 require_authentication(request, self._auths)
 
-            # Handler for route exists and is callable
-            if handler is not None and callable(handler):
+            # Handler for route exists
+            if handler is not None:
                 return handler(request)
 
             # No root_path, access to filesystem disabled, return 404.
@@ -450,10 +581,12 @@ class Server:  # pylint: disable=too-many-instance-attributes
             )
 
     def _set_default_server_headers(self, response: Response) -> None:
-        for name, value in self.headers.items():
-            response._headers.setdefault(  # pylint: disable=protected-access
-                name, value
-            )
+        if not self._headers:
+            return
+
+        setdefault = response._headers.setdefault  # pylint: disable=protected-access
+        for name, value in self._headers.items():
+            setdefault(name, value)
 
     def poll(  # pylint: disable=too-many-branches,too-many-return-statements
         self,
@@ -476,6 +609,14 @@ class Server:  # pylint: disable=too-many-instance-attributes
             conn, client_address = self._sock.accept()
             conn.settimeout(self._timeout)
 
+            # Disable Nagle's algorithm where supported, so small responses are not
+            # delayed waiting for an ACK of previously sent data
+            if self._tcp_nodelay_options is not None:
+                try:
+                    conn.setsockopt(*self._tcp_nodelay_options, 1)
+                except (AttributeError, OSError):
+                    pass
+
             # Receive the whole request
             if (request := self._receive_request(conn, client_address)) is None:
                 conn.close()
@@ -504,20 +645,13 @@ class Server:  # pylint: disable=too-many-instance-attributes
 
         except Exception as error:  # pylint: disable=broad-except
             if isinstance(error, OSError):
-                # There is no data available right now, try again later.
-                if error.errno == EAGAIN:
-                    return NO_REQUEST
-                # Connection reset by peer, try again later.
-                if error.errno == ECONNRESET:
-                    return NO_REQUEST
-                # Handshake failed, try again later.
-                if error.errno == MBEDTLS_ERR_SSL_FATAL_ALERT_MESSAGE:
+                if error.errno in _SUPPRESSIBLE_ERRNOS:
                     return NO_REQUEST
 
             # CPython specific SSL related errors
             if implementation.name != "circuitpython" and isinstance(error, SSLError):
                 # Ignore unknown SSL certificate errors
-                if getattr(error, "reason", None) == "SSLV3_ALERT_CERTIFICATE_UNKNOWN":
+                if getattr(error, "reason", None) == _SSL_CERTIFICATE_UNKNOWN_REASON:
                     return NO_REQUEST
 
             if self.debug:
@@ -582,6 +716,7 @@ class Server:  # pylint: disable=too-many-instance-attributes
     @request_buffer_size.setter
     def request_buffer_size(self, value: int) -> None:
         self._buffer = bytearray(value)
+        self._buffer_view = memoryview(self._buffer)
 
     @property
     def socket_timeout(self) -> int:
@@ -20,12 +20,15 @@ class Status:  # pylint: disable=too-few-public-methods
         """
         self.code = code
         self.text = text
+        self.line = f"HTTP/1.1 {code} {text}\r\n"
+        """Response status line, precomputed as it is sent with every response."""
+        self._str = f"{code} {text}"
 
     def __eq__(self, other: "Status"):
         return self.code == other.code and self.text == other.text
 
     def __str__(self):
-        return f"{self.code} {self.text}"
+        return self._str
 
     def __repr__(self):
         code = self.code
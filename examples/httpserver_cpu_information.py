@@ -18,17 +18,23 @@ server.headers = {
 }
 
 
+# Reused between requests to avoid allocating a new dict every time
+data = {
+    "temperature": None,
+    "frequency": None,
+    "voltage": None,
+}
+
+
 @server.route("/cpu-information", append_slash=True)
 def cpu_information_handler(request: Request):
     """
     Return the current CPU temperature, frequency, and voltage as JSON.
     """
 
-    data = {
-        "temperature": microcontroller.cpu.temperature,
-        "frequency": microcontroller.cpu.frequency,
-        "voltage": microcontroller.cpu.voltage,
-    }
+    data["temperature"] = microcontroller.cpu.temperature
+    data["frequency"] = microcontroller.cpu.frequency
+    data["voltage"] = microcontroller.cpu.voltage
 
     return JSONResponse(request, data)
 
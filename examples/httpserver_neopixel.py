@@ -23,9 +23,10 @@ def change_neopixel_color_handler_query_params(request: Request):
 
     # e.g. /change-neopixel-color?r=255&g=0&b=0
 
-    r = request.query_params.get("r") or 0
-    g = request.query_params.get("g") or 0
-    b = request.query_params.get("b") or 0
+    query_params = request.query_params
+    r = query_params.get("r") or 0
+    g = query_params.get("g") or 0
+    b = query_params.get("b") or 0
 
     pixel.fill((int(r), int(g), int(b)))
 
@@ -56,10 +56,12 @@ def redirect_other(request: Request, slug: str = None):
     Redirect to a URL based on the slug.
     """
 
-    if slug is None or slug not in REDIRECTS:
+    location = REDIRECTS.get(slug)
+
+    if location is None:
         return Response(request, "Unknown redirect", status=NOT_FOUND_404)
 
-    return Redirect(request, REDIRECTS.get(slug))
+    return Redirect(request, location)
 
 
 server.serve_forever(str(wifi.radio.ipv4_address))
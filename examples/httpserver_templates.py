@@ -18,6 +18,9 @@ except ImportError as e:
 pool = socketpool.SocketPool(wifi.radio)
 server = Server(pool, "/static", debug=True)
 
+# Compiled once, as compiling a regex on every request is expensive
+PATH_TRAVERSAL_REGEX = re.compile(r"\/(\.\.)\/|\/(\.\.)|(\.\.)\/")
+
 # Create /static directory if it doesn't exist
 try:
     os.listdir("/static")
@@ -34,16 +37,18 @@ def directory_listing(request: Request):
     path = request.query_params.get("path", "").replace("%20", " ")
 
     # Preventing path traversal by removing all ../ from path
-    path = re.sub(r"\/(\.\.)\/|\/(\.\.)|(\.\.)\/", "/", path).strip("/")
+    path = PATH_TRAVERSAL_REGEX.sub("/", path).strip("/")
+
+    full_path = f"/static/{path}"
 
     # If path is a file, return it as a file response
-    if is_file(f"/static/{path}"):
+    if is_file(full_path):
         return FileResponse(request, path)
 
     items = sorted(
         [
-            item + ("" if is_file(f"/static/{path}/{item}") else "/")
-            for item in os.listdir(f"/static/{path}")
+            item + ("" if is_file(f"{full_path}/{item}") else "/")
+            for item in os.listdir(full_path)
         ],
         key=lambda item: not item.endswith("/"),
     )
@@ -20,11 +20,30 @@ class Device:
         print("Turning off device.")
 
 
-def get_device(device_id: str) -> Device:  # pylint: disable=unused-argument
+# Maps action names to Device methods, built once instead of comparing
+# the action against lists on every request
+ACTIONS = {
+    "turn_on": Device.turn_on,
+    "turn_off": Device.turn_off,
+    "emergency_power_off": Device.turn_off,
+}
+
+devices = {}
+
+
+def get_device(device_id: str) -> Device:
     """
     This is a **made up** function that returns a `Device` object.
+
+    Devices are cached, so repeated requests for the same ID reuse the
+    existing object instead of constructing a new one every time.
     """
-    return Device()
+    device = devices.get(device_id)
+
+    if device is None:
+        device = devices[device_id] = Device()
+
+    return device
 
 
 @server.route("/device/<device_id>/action/<action>")
@@ -37,14 +56,13 @@ def perform_action(
     """
 
     device = get_device(device_id)
+    action_method = ACTIONS.get(action)
 
-    if action in ["turn_on"]:
-        device.turn_on()
-    elif action in ["turn_off", "emergency_power_off"]:
-        device.turn_off()
-    else:
+    if action_method is None:
         return Response(request, f"Unknown action ({action})")
 
+    action_method(device)
+
     return Response(
         request, f"Action ({action}) performed on device with ID: {device_id}"
     )